@@ -1,35 +1,66 @@
 """share — CLI file sharing backed by Cloudflare R2 + Workers KV. Zero cost, full ownership."""
 
+from __future__ import annotations
+
 import argparse
 import json
-import mimetypes
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
 import time
-import tomllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import boto3
-import cloudflare
-from rich.console import Console
-from rich.table import Table
 from sqids import Sqids
 
+if TYPE_CHECKING:
+    import cloudflare
+
+# boto3, cloudflare and rich are imported where used: together they are most
+# of the CLI's cold start, and e.g. `share --help` needs none of them.
+
 CONFIG_PATH = Path.home() / ".config" / "share" / "config.toml"
-console = Console()
+INDEX_PATH = CONFIG_PATH.parent / "index.json"
 sqids = Sqids()
 
 SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9._-]{0,62}$")
+R2_KEY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}/.")
+KV_WORKERS = 16
+R2_DELETE_BATCH = 1000  # DeleteObjects per-request key limit
+KV_METADATA_LIMIT = 1024
+SINGLE_PUT_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+MULTIPART_PART_SIZE = 50 * 1024 * 1024
+# upload_file only sees 8-64 MiB files; small parts keep them parallel.
+TRANSFER_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_WORKERS = 16
+HTTP_BLOCKSIZE = 1024 * 1024
+HTTP_POOL_SIZE = 32  # covers KV_WORKERS / MULTIPART_MAX_WORKERS fan-out
+
+
+@lru_cache(maxsize=1)
+def _console():
+    from rich.console import Console
 
+    return Console()
 
+
+@lru_cache(maxsize=1)
 def load_config() -> dict:
-    assert CONFIG_PATH.exists(), f"Config not found at {CONFIG_PATH}. Run: share setup"
-    with open(CONFIG_PATH, "rb") as f:
-        config = tomllib.load(f)
+    """Parsed config, read once per process. Treat as read-only."""
+    import tomllib
+
+    if not CONFIG_PATH.exists():
+        raise SystemExit(f"Config not found at {CONFIG_PATH}. Run: share setup")
+    config = tomllib.loads(CONFIG_PATH.read_text("utf-8"))
     for key in (
         "account_id",
         "r2_access_key_id",
@@ -38,27 +69,86 @@ def load_config() -> dict:
         "bucket",
         "kv_namespace_id",
     ):
-        assert key in config["cloudflare"], f"Missing config key: cloudflare.{key}"
-    assert "public_base" in config["urls"], "Missing config key: urls.public_base"
+        if key not in config["cloudflare"]:
+            raise SystemExit(f"Missing config key: cloudflare.{key}")
+    if "public_base" not in config["urls"]:
+        raise SystemExit("Missing config key: urls.public_base")
     return config
 
 
-def r2_client(config: dict):
-    cf = config["cloudflare"]
+def _raise_http_blocksize() -> None:
+    """Send request bodies in 1 MiB writes instead of http.client/urllib3's 8-16 KB.
+
+    Uploads are otherwise dominated by GIL churn on tiny socket writes.
+    """
+    import http.client
+
+    import urllib3.connection
+
+    init = http.client.HTTPConnection.__init__
+    init.__defaults__ = (*init.__defaults__[:-1], HTTP_BLOCKSIZE)
+    kwdefaults = urllib3.connection.HTTPConnection.__init__.__kwdefaults__
+    if kwdefaults and "blocksize" in kwdefaults:
+        kwdefaults["blocksize"] = HTTP_BLOCKSIZE
+
+
+@lru_cache(maxsize=1)
+def _r2_client(account_id: str, access_key_id: str, secret_access_key: str):
+    import boto3
+    from botocore.config import Config
+
+    _raise_http_blocksize()
     return boto3.client(
         "s3",
-        endpoint_url=f"https://{cf['account_id']}.r2.cloudflarestorage.com",
-        aws_access_key_id=cf["r2_access_key_id"],
-        aws_secret_access_key=cf["r2_secret_access_key"],
+        endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
         region_name="auto",
+        config=Config(
+            max_pool_connections=HTTP_POOL_SIZE,
+            retries={"max_attempts": 10, "mode": "adaptive"},
+        ),
+    )
+
+
+def _cf_transport_kwargs() -> dict:
+    """httpx settings shared by the sync and async Cloudflare clients."""
+    import httpx
+
+    return {
+        # HTTP/2 multiplexes the concurrent KV calls over one TLS connection;
+        # HTTP/1.1 stays enabled as a fallback if h2 isn't negotiated.
+        "http2": True,
+        "limits": httpx.Limits(
+            max_connections=HTTP_POOL_SIZE,
+            max_keepalive_connections=HTTP_POOL_SIZE,
+        ),
+    }
+
+
+@lru_cache(maxsize=1)
+def _cf_client(api_token: str) -> cloudflare.Cloudflare:
+    import cloudflare
+
+    return cloudflare.Cloudflare(
+        api_token=api_token,
+        http_client=cloudflare.DefaultHttpxClient(**_cf_transport_kwargs()),
+    )
+
+
+# Clients are built once per process and shared (both are thread-safe).
+def r2_client(config: dict):
+    cf = config["cloudflare"]
+    return _r2_client(
+        cf["account_id"], cf["r2_access_key_id"], cf["r2_secret_access_key"]
     )
 
 
 def cf_client(config: dict) -> cloudflare.Cloudflare:
-    return cloudflare.Cloudflare(api_token=config["cloudflare"]["api_token"])
+    return _cf_client(config["cloudflare"]["api_token"])
 
 
-def _parse_kv_value(raw: str) -> dict:
+def _parse_kv_value(raw: str | bytes) -> dict:
     """Parse KV value, handling the Python SDK's {metadata, value} wrapper."""
     parsed = json.loads(raw)
     if (
@@ -70,32 +160,33 @@ def _parse_kv_value(raw: str) -> dict:
     return parsed
 
 
-def kv_put(config: dict, cf: cloudflare.Cloudflare, key: str, value: dict) -> None:
-    cf.kv.namespaces.values.update(
-        key_name=key,
-        account_id=config["cloudflare"]["account_id"],
-        namespace_id=config["cloudflare"]["kv_namespace_id"],
-        value=json.dumps(value),
-        metadata=json.dumps({"name": value["name"], "size": value["size"]}),
-    )
+def _kv_metadata(value: dict) -> str:
+    """Mirror the entry into KV key metadata so kv_list can skip per-key GETs.
+
+    Falls back to empty metadata when the entry won't fit (e.g. very long URLs).
+    """
+    encoded = json.dumps(value)
+    return encoded if len(encoded.encode()) <= KV_METADATA_LIMIT else "{}"
 
 
-def kv_put_raw(config: dict, cf: cloudflare.Cloudflare, key: str, value: dict) -> None:
+def kv_put(config: dict, cf: cloudflare.Cloudflare, key: str, value: dict) -> None:
     cf.kv.namespaces.values.update(
         key_name=key,
         account_id=config["cloudflare"]["account_id"],
         namespace_id=config["cloudflare"]["kv_namespace_id"],
         value=json.dumps(value),
-        metadata="{}",
+        metadata=_kv_metadata(value),
     )
 
 
 def _read_kv_response(raw) -> dict:
-    """Read a BinaryAPIResponse from KV and parse the JSON value."""
-    return _parse_kv_value(raw.read().decode())
+    """Read a BinaryAPIResponse from KV and parse the JSON body as-is."""
+    return _parse_kv_value(raw.read())
 
 
 def kv_get(config: dict, cf: cloudflare.Cloudflare, key: str) -> dict | None:
+    import cloudflare
+
     try:
         raw = cf.kv.namespaces.values.get(
             key_name=key,
@@ -115,25 +206,162 @@ def kv_delete(config: dict, cf: cloudflare.Cloudflare, key: str) -> None:
     )
 
 
-def kv_list(config: dict, cf: cloudflare.Cloudflare) -> list[dict]:
-    keys = cf.kv.namespaces.keys.list(
-        account_id=config["cloudflare"]["account_id"],
-        namespace_id=config["cloudflare"]["kv_namespace_id"],
-    )
-    results = []
-    for key_obj in keys:
-        name = key_obj.name
-        if not name.startswith("slug:"):
-            continue
-        raw = cf.kv.namespaces.values.get(
-            key_name=name,
-            account_id=config["cloudflare"]["account_id"],
-            namespace_id=config["cloudflare"]["kv_namespace_id"],
-        )
-        results.append(_read_kv_response(raw))
+def _parse_key_metadata(metadata: object) -> dict | None:
+    """Full entry from a listed key's metadata, or None if only legacy/empty metadata."""
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+    if isinstance(metadata, dict) and "slug" in metadata:
+        return metadata
+    return None
+
+
+def run_async(coro):
+    """Run a coroutine on uvloop when it's installed, else the stdlib loop."""
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+async def kv_list_async(config: dict) -> dict[str, dict]:
+    """All entries, keyed by the slug in their KV key name."""
+    import asyncio
+
+    import cloudflare
+
+    account_id = config["cloudflare"]["account_id"]
+    namespace_id = config["cloudflare"]["kv_namespace_id"]
+    results = {}
+    # Cap in-flight GETs; they multiplex over one HTTP/2 connection.
+    limit = asyncio.Semaphore(KV_WORKERS)
+
+    def add(key_name: str, entry: dict) -> None:
+        # The key name is authoritative; older values may lack a slug field.
+        slug = key_name.removeprefix("slug:")
+        entry.setdefault("slug", slug)
+        results[slug] = entry
+
+    async def fetch(name: str) -> None:
+        async with limit:
+            raw = await cf.kv.namespaces.values.get(
+                key_name=name, account_id=account_id, namespace_id=namespace_id
+            )
+            add(name, _parse_kv_value(await raw.read()))
+
+    # Pages arrive lazily; entries written before metadata mirroring need
+    # their value GET, started as soon as their page is seen. The TaskGroup
+    # exits (joining every GET) before the client closes.
+    async with (
+        cloudflare.AsyncCloudflare(
+            api_token=config["cloudflare"]["api_token"],
+            http_client=cloudflare.DefaultAsyncHttpxClient(**_cf_transport_kwargs()),
+        ) as cf,
+        asyncio.TaskGroup() as tg,
+    ):
+        async for key_obj in cf.kv.namespaces.keys.list(
+            account_id=account_id, namespace_id=namespace_id, prefix="slug:"
+        ):
+            entry = _parse_key_metadata(key_obj.metadata)
+            if entry is not None:
+                add(key_obj.name, entry)
+            else:
+                tg.create_task(fetch(key_obj.name))
     return results
 
 
+def kv_list(config: dict) -> dict[str, dict]:
+    return run_async(kv_list_async(config))
+
+
+# --- Local index ---
+
+
+def load_index() -> dict[str, dict] | None:
+    """Cached slug → metadata map, or None if missing/unreadable (refetch from KV)."""
+    try:
+        with open(INDEX_PATH, encoding="utf-8") as f:
+            entries = json.load(f)["entries"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return entries if isinstance(entries, dict) else None
+
+
+@contextmanager
+def _index_lock():
+    """Serialize index writers so concurrent `share` runs don't lose entries."""
+    INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(INDEX_PATH.with_suffix(".lock"), "w") as lock:
+        try:
+            import fcntl
+        except ImportError:  # Windows: no flock, best effort
+            yield
+            return
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def save_index(entries: dict[str, dict]) -> None:
+    INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp file per writer, then an atomic rename over the index.
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=INDEX_PATH.parent,
+        prefix="index.",
+        suffix=".tmp",
+        delete=False,
+    ) as f:
+        try:
+            json.dump(
+                {
+                    "refreshed_at": datetime.now(timezone.utc).isoformat(),
+                    "entries": entries,
+                },
+                f,
+            )
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, INDEX_PATH)
+
+
+def refresh_index(config: dict) -> dict[str, dict]:
+    entries = kv_list(config)
+    with _index_lock():
+        save_index(entries)
+    return entries
+
+
+def update_index(changes: dict[str, dict | None]) -> None:
+    """Apply local writes to the index. A None entry removes the slug.
+
+    No-op when there's no index yet — the next ls hydrates it from KV.
+    Callers have already written KV, so a failure here only warns.
+    """
+    try:
+        with _index_lock():
+            entries = load_index()
+            if entries is None:
+                return
+            for slug, entry in changes.items():
+                if entry is None:
+                    entries.pop(slug, None)
+                else:
+                    entries[slug] = entry
+            save_index(entries)
+    except OSError as e:
+        _console().print(
+            f"[yellow]Local index not updated ({e}); run: share ls --refresh[/yellow]"
+        )
+
+
 IMAGE_EXTENSIONS = frozenset(
     {".jpg", ".jpeg", ".png", ".tiff", ".tif", ".webp", ".bmp", ".gif"}
 )
@@ -170,6 +398,7 @@ def _strip_image_metadata(path: Path) -> Path:
 
 
 def _strip_video_metadata(path: Path) -> tuple[Path | None, bool]:
+    console = _console()
     if not shutil.which("ffmpeg"):
         console.print(
             "[yellow]ffmpeg not found — video metadata NOT stripped (brew install ffmpeg)[/yellow]"
@@ -190,20 +419,183 @@ def _strip_video_metadata(path: Path) -> tuple[Path | None, bool]:
         ],
         capture_output=True,
     )
-    assert result.returncode == 0, (
-        f"ffmpeg metadata strip failed: {result.stderr.decode()}"
-    )
+    if result.returncode != 0:
+        raise SystemExit(f"ffmpeg metadata strip failed: {result.stderr.decode()}")
     return temp_path, True
 
 
+# Common types resolved without initializing the mimetypes database, which
+# scans system files like /etc/mime.types on first use.
+CONTENT_TYPES = {
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".html": "text/html",
+    ".css": "text/css",
+    ".csv": "text/csv",
+    ".js": "text/javascript",
+    ".json": "application/json",
+    ".pdf": "application/pdf",
+    ".zip": "application/zip",
+    ".gz": "application/gzip",
+    ".tar": "application/x-tar",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".heic": "image/heic",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/x-wav",
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".webm": "video/webm",
+}
+
+
+def guess_content_type(name: str) -> str:
+    content_type = CONTENT_TYPES.get(Path(name).suffix.lower())
+    if content_type:
+        return content_type
+    import mimetypes
+
+    return mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+
 def _format_size(size: int) -> str:
     if size < 1024:
         return f"{size} B"
-    if size < 1_048_576:
-        return f"{size / 1024:.1f} KB"
-    if size < 1_073_741_824:
-        return f"{size / 1_048_576:.1f} MB"
-    return f"{size / 1_073_741_824:.1f} GB"
+    if size < 1 << 20:
+        shift, unit = 10, "KB"
+    elif size < 1 << 30:
+        shift, unit = 20, "MB"
+    else:
+        shift, unit = 30, "GB"
+    # One decimal, rounded, in integer math — no float formatting per row.
+    whole, tenth = divmod((size * 10 + (1 << (shift - 1))) >> shift, 10)
+    return f"{whole}.{tenth} {unit}"
+
+
+def multipart_upload(s3, bucket: str, key: str, path: Path, extra_args: dict) -> None:
+    """Upload a large file as parallel PUTs of mmap slices to presigned part URLs.
+
+    Skips boto3's transfer manager, whose per-part send path is much slower
+    than plain concurrent PUTs. Each part carries a Content-MD5 computed from
+    the mapped slice, so the file is never reopened or read through twice.
+    """
+    import base64
+    import hashlib
+    import mmap
+
+    import urllib3
+
+    upload_id = s3.create_multipart_upload(Bucket=bucket, Key=key, **extra_args)[
+        "UploadId"
+    ]
+    size = path.stat().st_size
+    part_count = -(-size // MULTIPART_PART_SIZE)
+    workers = min(part_count, MULTIPART_MAX_WORKERS)
+    http = urllib3.PoolManager(
+        maxsize=workers,
+        timeout=urllib3.Timeout(connect=10, read=120),
+        # Presigned PUTs bypass botocore's retry handling; retry throttling
+        # and transient 5xx per part instead of aborting the whole upload.
+        retries=urllib3.Retry(
+            total=10,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods={"PUT"},
+            backoff_factor=0.5,
+            raise_on_status=False,
+        ),
+    )
+
+    try:
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+
+            def put_part(number: int) -> str:
+                start = (number - 1) * MULTIPART_PART_SIZE
+                with memoryview(mm)[start : start + MULTIPART_PART_SIZE] as body:
+                    # Hash the same mapped slice we send; R2 rejects the part
+                    # if the bytes it receives don't match.
+                    content_md5 = base64.b64encode(
+                        hashlib.md5(body, usedforsecurity=False).digest()
+                    ).decode()
+                    url = s3.generate_presigned_url(
+                        "upload_part",
+                        Params={
+                            "Bucket": bucket,
+                            "Key": key,
+                            "UploadId": upload_id,
+                            "PartNumber": number,
+                            "ContentMD5": content_md5,
+                        },
+                    )
+                    resp = http.request(
+                        "PUT", url, body=body, headers={"Content-MD5": content_md5}
+                    )
+                if resp.status != 200:
+                    raise SystemExit(
+                        f"Part {number} upload failed ({resp.status}): {resp.data.decode()}"
+                    )
+                return resp.headers["ETag"]
+
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                etags = list(ex.map(put_part, range(1, part_count + 1)))
+
+        s3.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": i, "ETag": etag}
+                    for i, etag in enumerate(etags, start=1)
+                ]
+            },
+        )
+    except BaseException:
+        s3.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        raise
+    finally:
+        http.clear()
+
+
+CLIPBOARD_COMMANDS = (
+    ("pbcopy",),
+    ("wl-copy",),
+    ("xclip", "-selection", "clipboard"),
+    ("xsel", "--clipboard", "--input"),
+)
+
+
+@lru_cache(maxsize=1)
+def _clipboard_command() -> tuple[str, ...] | None:
+    """First available clipboard tool, resolved to an absolute path once."""
+    for cmd in CLIPBOARD_COMMANDS:
+        path = shutil.which(cmd[0])
+        if path:
+            return (path, *cmd[1:])
+    return None
+
+
+def copy_to_clipboard(text: str) -> bool:
+    cmd = _clipboard_command()
+    if cmd is None:
+        return False
+    # The tool can exist but fail (no Wayland/X session, pbcopy over SSH).
+    # Output goes to DEVNULL, not a pipe: xclip forks a child that keeps it open.
+    result = subprocess.run(
+        cmd,
+        input=text.encode(),
+        check=False,
+        close_fds=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
 
 
 # --- Commands ---
@@ -215,31 +607,39 @@ EPOCH = 1773900000  # 2026-03-17, keeps sqids short
 def generate_slug(args_slug: str | None) -> str:
     if args_slug:
         slug = args_slug.lower().strip()
-        assert SLUG_RE.match(slug), (
-            f"Invalid slug '{slug}'. Use lowercase alphanumeric, dots, hyphens, underscores. Max 63 chars."
-        )
+        if not SLUG_RE.match(slug):
+            raise SystemExit(
+                f"Invalid slug '{slug}'. Use lowercase alphanumeric, dots, hyphens, underscores. Max 63 chars."
+            )
         return slug
     return sqids.encode([int(time.time()) - EPOCH])
 
 
 def cmd_upload(args: argparse.Namespace) -> None:
+    from boto3.s3.transfer import TransferConfig
+
+    console = _console()
     path = Path(args.file)
-    assert path.exists(), f"File not found: {path}"
-    assert path.is_file(), f"Not a file: {path}"
+    if not path.exists():
+        raise SystemExit(f"File not found: {path}")
+    if not path.is_file():
+        raise SystemExit(f"Not a file: {path}")
 
     config = load_config()
     name = args.name or path.name
     slug = generate_slug(getattr(args, "slug", None))
     date_prefix = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     r2_key = f"{date_prefix}/{name}"
-    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    content_type = guess_content_type(name)
+    public_url = f"{config['urls']['public_base']}/{slug}"
 
     s3 = r2_client(config)
     cf = cf_client(config)
 
     with console.status("Checking slug..."):
         existing = kv_get(config, cf, f"slug:{slug}")
-    assert not existing, f"Slug '{slug}' already taken. Pick another with --slug"
+    if existing:
+        raise SystemExit(f"Slug '{slug}' already taken. Pick another with --slug")
 
     config_default = config.get("upload", {}).get("strip_metadata", True)
     should_strip = args.strip_metadata or (config_default and not args.keep_metadata)
@@ -254,15 +654,44 @@ def cmd_upload(args: argparse.Namespace) -> None:
             console.print(f"[dim]Metadata stripped ({saved_kb:.0f} KB removed)[/dim]")
 
     size = upload_path.stat().st_size
+    # The slug rides along as object metadata so `rm <r2_key>` can find the KV
+    # entry with a HEAD instead of listing the namespace.
+    extra_args = {"ContentType": content_type, "Metadata": {"slug": slug}}
 
     try:
         with console.status(f"Uploading {name} ({size / 1_048_576:.1f} MB)..."):
-            s3.upload_file(
-                str(upload_path),
-                config["cloudflare"]["bucket"],
-                r2_key,
-                ExtraArgs={"ContentType": content_type},
-            )
+            if size > MULTIPART_THRESHOLD:
+                multipart_upload(
+                    s3,
+                    config["cloudflare"]["bucket"],
+                    r2_key,
+                    upload_path,
+                    extra_args,
+                )
+            elif size <= SINGLE_PUT_THRESHOLD:
+                # One request straight from the file object: no transfer
+                # manager threads, and the body goes out in HTTP_BLOCKSIZE writes.
+                with open(upload_path, "rb") as body:
+                    s3.put_object(
+                        Bucket=config["cloudflare"]["bucket"],
+                        Key=r2_key,
+                        Body=body,
+                        **extra_args,
+                    )
+            else:
+                s3.upload_file(
+                    str(upload_path),
+                    config["cloudflare"]["bucket"],
+                    r2_key,
+                    ExtraArgs=extra_args,
+                    Config=TransferConfig(
+                        multipart_threshold=SINGLE_PUT_THRESHOLD,
+                        multipart_chunksize=TRANSFER_PART_SIZE,
+                        max_concurrency=MULTIPART_MAX_WORKERS,
+                        io_chunksize=HTTP_BLOCKSIZE,
+                        use_threads=True,
+                    ),
+                )
     finally:
         if cleaned_path:
             cleaned_path.unlink(missing_ok=True)
@@ -280,17 +709,22 @@ def cmd_upload(args: argparse.Namespace) -> None:
 
     with console.status("Saving metadata..."):
         kv_put(config, cf, f"slug:{slug}", metadata)
+    update_index({slug: metadata})
 
-    public_url = f"{config['urls']['public_base']}/{slug}"
-    subprocess.run(["pbcopy"], input=public_url.encode(), check=False)
-    console.print(f"[green]{public_url}[/green] (copied)")
+    copied = copy_to_clipboard(public_url)
+    console.print(f"[green]{public_url}[/green]" + (" (copied)" if copied else ""))
 
 
 def cmd_ls(args: argparse.Namespace) -> None:
+    from rich.table import Table
+
+    console = _console()
     config = load_config()
-    cf = cf_client(config)
-    with console.status("Loading..."):
-        files = kv_list(config, cf)
+    entries = None if args.refresh else load_index()
+    if entries is None:
+        with console.status("Loading..."):
+            entries = refresh_index(config)
+    files = list(entries.values())
 
     if not files:
         console.print("[dim]No files shared yet.[/dim]")
@@ -305,13 +739,14 @@ def cmd_ls(args: argparse.Namespace) -> None:
         table = Table(title="Files")
         table.add_column("Slug", style="green")
         table.add_column("Name", style="cyan")
-        table.add_column("Size", style="yellow", justify="right")
-        table.add_column("Uploaded", style="dim")
-        table.add_column("DLs", justify="right")
-        table.add_column("Vis", style="dim")
+        table.add_column("Size", style="yellow", justify="right", no_wrap=True)
+        table.add_column("Uploaded", style="dim", no_wrap=True)
+        table.add_column("DLs", justify="right", no_wrap=True)
+        table.add_column("Vis", style="dim", no_wrap=True)
 
         total_size = 0
-        for f in sorted(file_entries, key=lambda x: x["uploaded_at"], reverse=True):
+        file_entries.sort(key=itemgetter("uploaded_at"), reverse=True)
+        for f in file_entries:
             total_size += f["size"]
             vis = "pub" if f.get("public") else ""
             table.add_row(
@@ -331,11 +766,12 @@ def cmd_ls(args: argparse.Namespace) -> None:
         table = Table(title="Links")
         table.add_column("Slug", style="green")
         table.add_column("URL", style="blue")
-        table.add_column("Created", style="dim")
-        table.add_column("Clicks", justify="right")
-        table.add_column("Vis", style="dim")
+        table.add_column("Created", style="dim", no_wrap=True)
+        table.add_column("Clicks", justify="right", no_wrap=True)
+        table.add_column("Vis", style="dim", no_wrap=True)
 
-        for f in sorted(link_entries, key=lambda x: x["created_at"], reverse=True):
+        link_entries.sort(key=itemgetter("created_at"), reverse=True)
+        for f in link_entries:
             vis = "pub" if f.get("public") else ""
             table.add_row(
                 f.get("slug", ""),
@@ -349,52 +785,121 @@ def cmd_ls(args: argparse.Namespace) -> None:
     console.print(f"[dim]{base}/<slug>[/dim]")
 
 
+def _find_by_r2_key(config: dict, r2_key: str) -> list[dict]:
+    """Resolve an r2_key from the slug stored in its object metadata."""
+    from botocore.exceptions import ClientError
+
+    try:
+        head = r2_client(config).head_object(
+            Bucket=config["cloudflare"]["bucket"], Key=r2_key
+        )
+    except ClientError:
+        return []
+    slug = head["Metadata"].get("slug")
+    if not slug:
+        return []  # uploaded before slugs were stored on the object
+    return [{"slug": slug, "r2_key": r2_key, "name": r2_key.split("/", 1)[1]}]
+
+
 def cmd_rm(args: argparse.Namespace) -> None:
+    console = _console()
     config = load_config()
     cf = cf_client(config)
 
-    with console.status("Loading..."):
-        files = kv_list(config, cf)
-    matches = [
-        f
-        for f in files
-        if f.get("slug") == args.name
-        or f.get("name") == args.name
-        or f.get("r2_key") == args.name
-        or f.get("url") == args.name
-    ]
-
-    assert matches, f"Not found: {args.name}. Use slug, filename, URL, or r2_key."
-    if len(matches) > 1:
-        console.print(f"[yellow]Multiple matches for '{args.name}':[/yellow]")
-        for f in matches:
-            label = f.get("name") or f.get("url", "")
-            console.print(f"  {f.get('slug', '?'):15} {label}")
+    def lookups(entries: dict[str, dict]):
+        """r2_key → entry and filename/URL → entries, built once per index."""
+        by_key, by_label = {}, {}
+        for f in entries.values():
+            if "r2_key" in f:
+                by_key[f["r2_key"]] = f
+            for label in {f.get("name"), f.get("url")} - {None}:
+                by_label.setdefault(label, []).append(f)
+        return by_key, by_label
+
+    def find(entries: dict[str, dict], by_key, by_label, name: str) -> list[dict]:
+        # Slugs and r2_keys are unique, so they resolve directly; only
+        # filenames and URLs can be ambiguous.
+        if name in entries:
+            return [entries[name]]
+        if name in by_key:
+            return [by_key[name]]
+        return by_label.get(name, [])
+
+    entries = load_index() or {}
+    by_key, by_label = lookups(entries)
+    matches = {name: find(entries, by_key, by_label, name) for name in args.name}
+    for name, found in matches.items():
+        if not found and R2_KEY_RE.match(name):
+            matches[name] = _find_by_r2_key(config, name)
+    if not all(matches.values()):
+        # Index may be stale (e.g. uploads from another machine) — recheck KV.
+        with console.status("Loading..."):
+            entries = refresh_index(config)
+        by_key, by_label = lookups(entries)
+        matches = {
+            name: found or find(entries, by_key, by_label, name)
+            for name, found in matches.items()
+        }
+
+    missing = [name for name, found in matches.items() if not found]
+    if missing:
+        raise SystemExit(
+            f"Not found: {', '.join(missing)}. Use slug, filename, URL, or r2_key."
+        )
+    ambiguous = {name: found for name, found in matches.items() if len(found) > 1}
+    if ambiguous:
+        for name, found in ambiguous.items():
+            console.print(f"[yellow]Multiple matches for '{name}':[/yellow]")
+            for f in found:
+                label = f.get("name") or f.get("url", "")
+                console.print(f"  {f.get('slug', '?'):15} {label}")
         console.print("[yellow]Use the slug to delete a specific one.[/yellow]")
         return
 
-    target = matches[0]
-
-    with console.status("Deleting..."):
-        if target.get("type") != "link":
-            s3 = r2_client(config)
-            s3.delete_object(
-                Bucket=config["cloudflare"]["bucket"], Key=target["r2_key"]
+    targets = list({found[0]["slug"]: found[0] for found in matches.values()}.values())
+    r2_keys = [t["r2_key"] for t in targets if t.get("type") != "link"]
+
+    def delete_objects() -> None:
+        if not r2_keys:
+            return
+        s3 = r2_client(config)
+        for i in range(0, len(r2_keys), R2_DELETE_BATCH):
+            resp = s3.delete_objects(
+                Bucket=config["cloudflare"]["bucket"],
+                Delete={
+                    "Objects": [{"Key": k} for k in r2_keys[i : i + R2_DELETE_BATCH]],
+                    "Quiet": True,
+                },
             )
-        kv_delete(config, cf, f"slug:{target['slug']}")
+            errors = resp.get("Errors", [])
+            if errors:
+                raise SystemExit(f"R2 delete failed: {errors}")
+
+    def delete_kv() -> None:
+        with ThreadPoolExecutor(max_workers=KV_WORKERS) as ex:
+            list(ex.map(lambda t: kv_delete(config, cf, f"slug:{t['slug']}"), targets))
 
-    label = target.get("name") or target.get("url", "")
-    console.print(f"[red]Deleted {label} (/{target.get('slug', '')})[/red]")
+    # R2 and KV are separate services; run both deletes at once.
+    with console.status("Deleting..."), ThreadPoolExecutor(max_workers=2) as ex:
+        for future in as_completed((ex.submit(delete_objects), ex.submit(delete_kv))):
+            future.result()
+    update_index({t["slug"]: None for t in targets})
+
+    for target in targets:
+        label = target.get("name") or target.get("url", "")
+        console.print(f"[red]Deleted {label} (/{target.get('slug', '')})[/red]")
 
 
 def cmd_link(args: argparse.Namespace) -> None:
+    console = _console()
     config = load_config()
     cf = cf_client(config)
     slug = generate_slug(getattr(args, "slug", None))
 
     with console.status("Checking slug..."):
         existing = kv_get(config, cf, f"slug:{slug}")
-    assert not existing, f"Slug '{slug}' already taken. Pick another with --slug"
+    if existing:
+        raise SystemExit(f"Slug '{slug}' already taken. Pick another with --slug")
 
     metadata = {
         "type": "link",
@@ -405,15 +910,19 @@ def cmd_link(args: argparse.Namespace) -> None:
         "public": args.public,
     }
 
+    short_url = f"{config['urls']['public_base']}/{slug}"
     with console.status("Saving..."):
-        kv_put_raw(config, cf, f"slug:{slug}", metadata)
+        kv_put(config, cf, f"slug:{slug}", metadata)
+    update_index({slug: metadata})
 
-    short_url = f"{config['urls']['public_base']}/{slug}"
-    subprocess.run(["pbcopy"], input=short_url.encode(), check=False)
-    console.print(f"[green]{short_url}[/green] → {args.url} (copied)")
+    copied = copy_to_clipboard(short_url)
+    console.print(
+        f"[green]{short_url}[/green] → {args.url}" + (" (copied)" if copied else "")
+    )
 
 
 def cmd_setup(args: argparse.Namespace) -> None:
+    console = _console()
     console.print("[bold]share setup[/bold]\n")
     console.print("You need from the Cloudflare dashboard:")
     console.print("  1. Account ID (dashboard URL or wrangler whoami)")
@@ -431,34 +940,40 @@ def cmd_setup(args: argparse.Namespace) -> None:
     api_token = Prompt.ask("CF API Token")
     bucket = Prompt.ask("R2 Bucket name", default="share")
 
-    s3 = boto3.client(
-        "s3",
-        endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
-        aws_access_key_id=r2_access_key_id,
-        aws_secret_access_key=r2_secret_access_key,
-        region_name="auto",
-    )
-
-    try:
-        s3.head_bucket(Bucket=bucket)
-        console.print(f"[green]Bucket '{bucket}' exists.[/green]")
-    except Exception:
-        console.print(f"[yellow]Creating bucket '{bucket}'...[/yellow]")
-        s3.create_bucket(Bucket=bucket)
-        console.print(f"[green]Bucket '{bucket}' created.[/green]")
-
-    cf = cloudflare.Cloudflare(api_token=api_token)
-    namespaces = cf.kv.namespaces.list(account_id=account_id)
-    existing = [ns for ns in namespaces if ns.title == "share"]
-
-    if existing:
-        kv_namespace_id = existing[0].id
-        console.print(f"[green]KV namespace 'share' found: {kv_namespace_id}[/green]")
-    else:
-        console.print("[yellow]Creating KV namespace 'share'...[/yellow]")
-        ns = cf.kv.namespaces.create(account_id=account_id, title="share")
-        kv_namespace_id = ns.id
-        console.print(f"[green]KV namespace created: {kv_namespace_id}[/green]")
+    def ensure_bucket() -> None:
+        s3 = _r2_client(account_id, r2_access_key_id, r2_secret_access_key)
+        try:
+            s3.head_bucket(Bucket=bucket)
+            console.print(f"[green]Bucket '{bucket}' exists.[/green]")
+        except Exception:
+            console.print(f"[yellow]Creating bucket '{bucket}'...[/yellow]")
+            s3.create_bucket(Bucket=bucket)
+            console.print(f"[green]Bucket '{bucket}' created.[/green]")
+
+    def ensure_namespace() -> str:
+        cf = _cf_client(api_token)
+        namespaces = cf.kv.namespaces.list(account_id=account_id)
+        existing = [ns for ns in namespaces if ns.title == "share"]
+
+        if existing:
+            kv_namespace_id = existing[0].id
+            console.print(
+                f"[green]KV namespace 'share' found: {kv_namespace_id}[/green]"
+            )
+        else:
+            console.print("[yellow]Creating KV namespace 'share'...[/yellow]")
+            ns = cf.kv.namespaces.create(account_id=account_id, title="share")
+            kv_namespace_id = ns.id
+            console.print(f"[green]KV namespace created: {kv_namespace_id}[/green]")
+        return kv_namespace_id
+
+    # R2 and KV are independent services — check both at once.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        bucket_future = ex.submit(ensure_bucket)
+        namespace_future = ex.submit(ensure_namespace)
+        for future in as_completed((bucket_future, namespace_future)):
+            future.result()
+    kv_namespace_id = namespace_future.result()
 
     public_base = Prompt.ask("Your domain (e.g. https://yourdomain.com)")
     public_base = public_base.rstrip("/")
@@ -515,10 +1030,15 @@ def main():
     p_link.add_argument("--slug", help="Custom slug (auto-generated if omitted)")
     p_link.add_argument("--public", action="store_true", help="Show on landing page")
 
-    sub.add_parser("ls", help="List files and links")
+    p_ls = sub.add_parser("ls", help="List files and links")
+    p_ls.add_argument(
+        "--refresh", action="store_true", help="Re-fetch from KV instead of local index"
+    )
 
-    p_rm = sub.add_parser("rm", help="Delete a file or link")
-    p_rm.add_argument("name", help="Slug, filename, URL, or r2_key to delete")
+    p_rm = sub.add_parser("rm", help="Delete files or links")
+    p_rm.add_argument(
+        "name", nargs="+", help="Slugs, filenames, URLs, or r2_keys to delete"
+    )
 
     sub.add_parser("setup", help="Configure Cloudflare credentials")
 
@@ -0,0 +1,3 @@
+from share import main
+
+main()
@@ -56,7 +56,7 @@ async function serveSlug(
 
 	if (meta.type === "link") {
 		meta.clicks = (meta.clicks || 0) + 1;
-		await env.KV.put(`slug:${slug}`, JSON.stringify(meta));
+		await putMeta(env, slug, meta);
 		return Response.redirect(meta.url, 301);
 	}
 
@@ -126,7 +126,7 @@ async function serveFile(
 		// Increment download counter only on first chunk
 		if (r.offset === 0) {
 			meta.downloads += 1;
-			await env.KV.put(`slug:${slug}`, JSON.stringify(meta));
+			await putMeta(env, slug, meta);
 		}
 
 		return new Response(object.body, { status: 206, headers });
@@ -136,7 +136,7 @@ async function serveFile(
 
 	// Increment download counter
 	meta.downloads += 1;
-	await env.KV.put(`slug:${slug}`, JSON.stringify(meta));
+	await putMeta(env, slug, meta);
 
 	return new Response(object.body, { headers });
 }
@@ -165,6 +165,14 @@ function parseKVValue(raw: string): FileMeta {
 	return parsed;
 }
 
+// Key metadata mirrors the value so the CLI can list everything in one call.
+// KV caps metadata at 1024 bytes; oversized entries keep empty metadata.
+async function putMeta(env: Env, slug: string, meta: FileMeta): Promise<void> {
+	const value = JSON.stringify(meta);
+	const metadata = new TextEncoder().encode(value).length <= 1024 ? meta : {};
+	await env.KV.put(`slug:${slug}`, value, { metadata });
+}
+
 async function listFiles(env: Env): Promise<FileMeta[]> {
 	const list = await env.KV.list({ prefix: "slug:" });
 	const files: FileMeta[] = [];